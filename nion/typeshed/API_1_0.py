@@ -1,3 +1,4 @@
+import concurrent.futures
 import datetime
 import numpy
 import typing
@@ -223,6 +224,213 @@ class Graphic:
         ...
 
 
+class GraphicCollection:
+    """Represents a collection of graphics of the same type created in bulk.
+
+    The geometry of the graphics is stored compactly and exposed as numpy arrays in relative coordinates. Individual
+    :py:class:`Graphic` objects are only created when indexing or iterating the collection.
+
+    .. versionadded:: 1.0
+    """
+
+    def __getitem__(self, index: int) -> Graphic:
+        ...
+
+    def __iter__(self) -> typing.Iterator[Graphic]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @property
+    def bounds(self) -> numpy.ndarray:
+        """Return the bounds of the graphics in relative coordinates.
+
+        Bounds is an array of shape (n, 2, 2) where each entry is ((top, left), (height, width)). For points the height
+        and width are zero. For lines the bounds are the bounding box of the line, with non-negative height and width.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    @property
+    def graphic_type(self) -> str:
+        """Return the type of the graphics in this collection.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    @property
+    def positions(self) -> numpy.ndarray:
+        """Return the positions of the graphics in relative coordinates.
+
+        Positions is an array of shape (n, 2) where each entry is (y, x). For rectangles and ellipses the position is
+        the center. For lines the position is the midpoint.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    @property
+    def vectors(self) -> typing.Optional[numpy.ndarray]:
+        """Return the vectors of line graphics in relative coordinates.
+
+        Vectors is an array of shape (n, 2, 2) where each entry is ((y_start, x_start), (y_end, x_end)). Vectors is None
+        for collections of graphics other than lines.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+
+class DataView:
+    """Represents a lazy view onto the data of a data item.
+
+    The data is read from and written to the storage of the data item on demand. For large format data items the
+    storage is memory mapped, so only the slices accessed are brought into memory.
+
+    Indexing follows the numpy rules for basic slicing, including a single int or slice, tuples and ``...``::
+
+        frame = data_item.data_view[12, 34]  # a single scan position of a 4d data item
+        data_item.data_view[12, 34] = frame
+        data_item.data_view[0] = 0  # values may be scalars
+        column = data_item.data_view[..., 3]
+
+    Tuple keys may contain ints, slices and ``...`` (Ellipsis). Indexing returns a :py:class:`numpy.ndarray`, except
+    that indexing every dimension with an int returns a numpy scalar.
+
+    .. versionadded:: 1.0
+    """
+
+    def __getitem__(self, key: typing.Union[int, slice, typing.Tuple[typing.Any, ...]]) -> typing.Any:
+        ...
+
+    def __setitem__(self, key: typing.Union[int, slice, typing.Tuple[typing.Any, ...]], value: typing.Union[numpy.ndarray, int, float, complex]) -> None:
+        ...
+
+    def read_slice(self, slices: typing.Tuple[typing.Union[int, slice], ...]) -> numpy.ndarray:
+        """Read a slice of the data.
+
+        :param slices: A tuple of ints or slices, one per dimension.
+        :return: A copy of the data in the slice.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def write_slice(self, slices: typing.Tuple[typing.Union[int, slice], ...], array: typing.Union[numpy.ndarray, int, float, complex]) -> None:
+        """Write a slice of the data.
+
+        :param slices: A tuple of ints or slices, one per dimension.
+        :param array: The data to write, an array or a scalar, must be broadcastable to the shape of the slice.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        """Return the dtype of the data.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    @property
+    def shape(self) -> typing.Tuple[int, ...]:
+        """Return the shape of the data.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+
+class DisplayPyramid:
+    """Represents a multi-resolution pyramid of the display data of a data item.
+
+    Level 0 is the full resolution display data and each following level is downsampled by a factor of two in each
+    dimension, down to a level that fits within a single tile. Levels are computed lazily when first requested and
+    cached.
+
+    When the data of the data item changes, the affected parts of the cached levels are invalidated and recomputed on
+    next request. Changes made with :py:meth:`DataItem.update_data_region` only invalidate the corresponding regions.
+
+    The display data also depends on the display properties that select and convert the data, such as the display
+    type, the sequence and collection slice indexes and the complex display type. When any of these changes, all the
+    cached levels are invalidated and recomputed from the new display data on next request. Level shapes may change
+    as a result, so callers should not keep level shapes across display property changes.
+
+    .. versionadded:: 1.0
+    """
+
+    def get_level_for_viewport(self, viewport_shape: typing.Sequence[int], bounds: typing.Tuple[typing.Tuple[float, float], typing.Tuple[float, float]]=None) -> int:
+        """Return the coarsest level with at least as many pixels as the viewport over the visible region.
+
+        :param viewport_shape: The shape of the viewport in screen pixels (height, width).
+        :param bounds: The visible region in relative coordinates ((top, left), (height, width)). Pass None for all.
+        :return: The level index.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def get_level_shape(self, level: int) -> typing.Tuple[int, ...]:
+        """Return the shape of a level without computing it.
+
+        :param level: The level index.
+        :return: The shape of the level.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def get_level_xdata(self, level: int, bounds: typing.Tuple[typing.Tuple[float, float], typing.Tuple[float, float]]=None) -> DataAndMetadata.DataAndMetadata:
+        """Return the display data of a level as extended data.
+
+        :param level: The level index.
+        :param bounds: The region to return in relative coordinates ((top, left), (height, width)). Pass None for all.
+        :return: The display data of the level, with calibrations scaled to match.
+
+        Only the region requested is computed if the level is not already cached.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    @property
+    def level_count(self) -> int:
+        """Return the number of levels.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+
 class DataItem:
 
     def add_channel_region(self, position: float) -> Graphic:
@@ -231,12 +439,47 @@ class DataItem:
     def add_ellipse_region(self, center_y: float, center_x: float, height: float, width: float) -> Graphic:
         ...
 
+    def add_ellipse_regions(self, bounds: numpy.ndarray) -> GraphicCollection:
+        """Add ellipse graphics to the data item in bulk.
+
+        :param bounds: An array of shape (n, 2, 2) where each entry is ((top, left), (height, width)) in relative units.
+        :return: The :py:class:`nion.swift.Facade.GraphicCollection` object that was added.
+
+        The layout is the same as :py:attr:`nion.swift.Facade.GraphicCollection.bounds` and ``Graphic.bounds``, so the
+        bounds of an existing collection can be passed back in.
+
+        Raises ValueError if bounds does not have shape (n, 2, 2).
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def add_interval_region(self, start: float, end: float) -> Graphic:
         ...
 
     def add_line_region(self, start_y: float, start_x: float, end_y: float, end_x: float) -> Graphic:
         ...
 
+    def add_line_regions(self, vectors: numpy.ndarray) -> GraphicCollection:
+        """Add line graphics to the data item in bulk.
+
+        :param vectors: An array of shape (n, 2, 2) where each entry is ((start_y, start_x), (end_y, end_x)) in relative
+            units.
+        :return: The :py:class:`nion.swift.Facade.GraphicCollection` object that was added.
+
+        The layout is the same as :py:attr:`nion.swift.Facade.GraphicCollection.vectors` and ``Graphic.vector``, so the
+        vectors of an existing collection can be passed back in.
+
+        Raises ValueError if vectors does not have shape (n, 2, 2).
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def add_point_region(self, y: float, x: float) -> Graphic:
         """Add a point graphic to the data item.
 
@@ -250,9 +493,94 @@ class DataItem:
         """
         ...
 
+    def add_point_regions(self, yx: numpy.ndarray) -> GraphicCollection:
+        """Add point graphics to the data item in bulk.
+
+        :param yx: An array of shape (n, 2) where each row is (y, x) in relative units [0.0, 1.0].
+        :return: The :py:class:`nion.swift.Facade.GraphicCollection` object that was added.
+
+        The layout is the same as :py:attr:`nion.swift.Facade.GraphicCollection.positions`.
+
+        Raises ValueError if yx does not have shape (n, 2).
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def add_rectangle_region(self, center_y: float, center_x: float, height: float, width: float) -> Graphic:
         ...
 
+    def add_rectangle_regions(self, bounds: numpy.ndarray) -> GraphicCollection:
+        """Add rectangle graphics to the data item in bulk.
+
+        :param bounds: An array of shape (n, 2, 2) where each entry is ((top, left), (height, width)) in relative units.
+        :return: The :py:class:`nion.swift.Facade.GraphicCollection` object that was added.
+
+        The layout is the same as :py:attr:`nion.swift.Facade.GraphicCollection.bounds` and ``Graphic.bounds``, so the
+        bounds of an existing collection can be passed back in.
+
+        Raises ValueError if bounds does not have shape (n, 2, 2).
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def batch_update(self) -> "typing.ContextManager[DataItem]":
+        """Return a context manager to apply changes to the data item as a single transaction.
+
+        Changes to the title, calibrations, metadata and metadata values made within the context are written once and
+        notified once, on exit::
+
+            with data_item.batch_update():
+                data_item.title = "Spectrum Image"
+                data_item.set_dimensional_calibrations(dimensional_calibrations)
+                data_item.set_intensity_calibration(intensity_calibration)
+                data_item.set_metadata_value("session.instrument", "UltraSTEM")
+
+        If an exception is raised within the context, the changes made within it are rolled back; nothing is written
+        or notified and the exception propagates.
+
+        Nested batch updates, and batch updates within a :py:meth:`nion.swift.Facade.Library.transaction`, join the
+        outermost one: changes are written or rolled back only when it exits.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def begin_data_update(self) -> None:
+        """Begin a batch of data region updates.
+
+        Region updates made between begin and end are accumulated and stored and propagated to dependents once, when the
+        matching :py:meth:`end_data_update` is called. Calls to begin/end data update should be matched and may be
+        nested.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def data_update(self) -> "typing.ContextManager[None]":
+        """Return a context manager to batch data region updates.
+
+        Equivalent to calling :py:meth:`begin_data_update` on enter and :py:meth:`end_data_update` on exit::
+
+            with data_item.data_update():
+                for row_index, row in enumerate(rows):
+                    data_item.update_data_region((row_index, slice(None)), row)
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def delete_metadata_value(self, key: str) -> None:
         """Delete the metadata value for the given key.
 
@@ -271,6 +599,17 @@ class DataItem:
         """
         ...
 
+    def end_data_update(self) -> None:
+        """End a batch of data region updates.
+
+        See :py:meth:`begin_data_update`.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def get_metadata_value(self, key: str) -> typing.Any:
         """Get the metadata value for the given key.
 
@@ -307,6 +646,51 @@ class DataItem:
         """
         ...
 
+    def labeled_mask_xdata_with_shape(self, graphics: typing.Union[GraphicCollection, typing.Sequence[Graphic]]=None, shape: typing.Sequence[int]=None) -> DataAndMetadata.DataAndMetadata:
+        """Return a labeled mask for the graphics as extended data, computed in a single pass.
+
+        :param graphics: The graphics to include. Pass None for all mask graphics on this data item.
+        :param shape: The shape of the mask. Pass None to use the shape of the data.
+        :return: An int32 mask where pixels inside graphics[i] have label i + 1 and other pixels are 0.
+
+        The mask is always int32, whatever the number of graphics, so labels cannot overflow.
+
+        Where graphics overlap, the pixel has the label of the last graphic. Use
+        :py:meth:`mask_stack_xdata_with_shape` when overlapping graphics must be kept separate.
+
+        Masks are cached using the geometry of each graphic and the shape, so repeated calls with unchanged graphics
+        do not recompute the mask.
+
+        Raises ValueError if any of the graphics passed is not a mask graphic, i.e. a graphic that does not enclose an
+        area, such as a point, line or interval.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def mask_stack_xdata_with_shape(self, graphics: typing.Union[GraphicCollection, typing.Sequence[Graphic]]=None, shape: typing.Sequence[int]=None) -> DataAndMetadata.DataAndMetadata:
+        """Return a stack of masks for the graphics as extended data, computed in a single pass.
+
+        :param graphics: The graphics to include. Pass None for all mask graphics on this data item.
+        :param shape: The shape of each mask. Pass None to use the shape of the data.
+        :return: A boolean sequence of masks where index i is the mask of graphics[i].
+
+        Each mask is the same as the one returned by :py:meth:`nion.swift.Facade.Graphic.mask_xdata_with_shape`.
+
+        Masks are cached using the geometry of each graphic and the shape, so repeated calls with unchanged graphics
+        do not recompute the mask.
+
+        Raises ValueError if any of the graphics passed is not a mask graphic, i.e. a graphic that does not enclose an
+        area, such as a point, line or interval.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def mask_xdata(self) -> DataAndMetadata.DataAndMetadata:
         """Return the mask by combining any mask graphics on this data item as extended data.
 
@@ -319,6 +703,17 @@ class DataItem:
     def remove_region(self, graphic: Graphic) -> None:
         ...
 
+    def remove_regions(self, graphics: typing.Union[GraphicCollection, typing.Sequence[Graphic]]) -> None:
+        """Remove graphics from the data item in bulk.
+
+        :param graphics: The :py:class:`nion.swift.Facade.GraphicCollection` or list of graphics to remove.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def set_data(self, data: numpy.ndarray) -> None:
         """Set the data.
 
@@ -397,6 +792,23 @@ class DataItem:
         """
         ...
 
+    def update_data_region(self, slices: typing.Tuple[typing.Union[int, slice], ...], values: typing.Union[numpy.ndarray, int, float, complex]) -> None:
+        """Update a region of the data in place.
+
+        :param slices: A tuple of ints or slices, one per dimension, describing the region.
+        :param values: The new values, an array or a scalar, must be broadcastable to the shape of the region.
+
+        Only the region is marked as changed, so storage and dependent computations can process the change rather than
+        the whole data. The shape and dtype of the data cannot be changed this way.
+
+        If called outside of a data update batch, the change is stored and propagated immediately.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     @property
     def created(self) -> datetime.datetime:
         """Return the created timestamp (UTC) as a datetime object.
@@ -441,6 +853,19 @@ class DataItem:
         """
         ...
 
+    @property
+    def data_view(self) -> DataView:
+        """Return a lazy view of the data.
+
+        Unlike ``data``, the view does not load the data into memory. Use it to access slices of large format data
+        items without materializing the whole data.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     @property
     def dimensional_calibrations(self) -> typing.List[Calibration.Calibration]:
         """Return a copy of the list of dimensional calibrations.
@@ -455,12 +880,30 @@ class DataItem:
     def display(self) -> "Display":
         ...
 
+    @property
+    def display_pyramid(self) -> DisplayPyramid:
+        """Return the multi-resolution pyramid of the display data.
+
+        Use the pyramid to get display data at a resolution matching the viewport rather than the full data::
+
+            pyramid = data_item.display_pyramid
+            level = pyramid.get_level_for_viewport((1080, 1920), bounds)
+            xdata = pyramid.get_level_xdata(level, bounds)
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     @property
     def display_xdata(self) -> DataAndMetadata.DataAndMetadata:
         """Return the extended data of this data item display.
 
         Display data will always be 1d or 2d and either int, float, or RGB data type.
 
+        This is level 0 of :py:attr:`display_pyramid`.
+
         .. versionadded:: 1.0
 
         Scriptable: Yes
@@ -487,6 +930,16 @@ class DataItem:
         """
         ...
 
+    @property
+    def large_format(self) -> bool:
+        """Return whether the data item uses large format (memory mapped) storage.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     @property
     def metadata(self) -> dict:
         """Return a copy of the metadata as a dict.
@@ -660,6 +1113,35 @@ class DataGroup:
         ...
 
 
+class Range:
+    """Represents a half-open range of values, start <= value < end, used as a condition when searching.
+
+    Use :samp:`api.create_range(start, end)` to create a range.
+
+    .. versionadded:: 1.0
+    """
+
+    @property
+    def end(self) -> typing.Any:
+        """Return the end of the range (exclusive), or None if the range is open at the end.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    @property
+    def start(self) -> typing.Any:
+        """Return the start of the range (inclusive), or None if the range is open at the start.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+
 class Library:
 
     def copy_data_item(self, data_item: DataItem) -> DataItem:
@@ -720,6 +1202,30 @@ class Library:
         """
         ...
 
+    def create_data_item_from_data_descriptor(self, data_shape: typing.Sequence[int], data_dtype: numpy.dtype, data_descriptor: DataAndMetadata.DataDescriptor, title: str=None, large_format: bool=False) -> DataItem:
+        """Create a data item in the library with preallocated data of the given shape and dtype.
+
+        :param data_shape: The shape of the data.
+        :param data_dtype: The dtype of the data.
+        :param data_descriptor: The data descriptor describing the dimensions, see
+            :py:meth:`nion.swift.Facade.API.create_data_descriptor`.
+        :param title: The title of the data item (optional).
+        :param large_format: Whether to use large format (memory mapped) storage.
+        :return: The new :py:class:`nion.swift.Facade.DataItem` object.
+        :rtype: :py:class:`nion.swift.Facade.DataItem`
+
+        The data is initialized to zero. Fill it a slot at a time using
+        :py:meth:`nion.swift.Facade.DataItem.update_data_region`, ``data_view``, or by passing the data item to
+        ``HardwareSource.create_record_task`` or ``ViewTask.grab_next_to_finish_into``.
+
+        Raises ValueError if the data shape is not consistent with the data descriptor.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def data_ref_for_data_item(self, data_item: DataItem):
         ...
 
@@ -734,6 +1240,34 @@ class Library:
         """
         ...
 
+    def find_data_items(self, where: typing.Mapping[str, typing.Union[Range, typing.Any]]) -> typing.List[DataItem]:
+        """Return the data items matching all of the conditions.
+
+        :param where: A dict mapping keys to the value to match.
+        :return: The list of :py:class:`nion.swift.Facade.DataItem` objects.
+
+        Keys are metadata keys as used by ``set_metadata_value``, e.g. 'session.instrument' or 'camera.binning', or one
+        of the data item properties 'created', 'modified' or 'title'.
+
+        A :py:class:`Range` value matches values in the range. Any other value matches by equality, except that
+        sequences compare element-wise, so a tuple and a list with equal elements are equivalent. This matters because
+        metadata is stored as JSON, where tuples become lists: a value set as ``(2, 2)`` is ``[2, 2]`` once the data
+        item is reloaded, and either form matches it::
+
+            created_range = api.create_range(start, end)
+            library.find_data_items(where={"session.instrument": "UltraSTEM", "created": created_range})
+            library.find_data_items(where={"camera.binning": (2, 2)})  # also matches a stored [2, 2]
+
+        The library maintains indexes over the metadata keys, so the search does not scan every data item. Values are
+        normalized the same way when building the indexes, with sequences (including nested ones) converted to tuples.
+
+        .. versionadded:: 1.0
+
+        Status: Provisional
+        Scriptable: Yes
+        """
+        ...
+
     def get_data_item_by_uuid(self, data_item_uuid: uuid.UUID) -> DataItem:
         """Get the data item with the given UUID.
 
@@ -751,8 +1285,41 @@ class Library:
         :param channel_id: The (optional) channel id.
         :param processor_id: The (optional) processor id for the channel.
         :param create_if_needed: Whether to create a new data item if none is found.
+        :param large_format: Whether a created data item should use large format (memory mapped) storage.
         :return: The associated data item. May be None.
 
+        Use :py:attr:`nion.swift.Facade.DataItem.data_view` to access slices of large format data items.
+
+        .. versionadded:: 1.0
+
+        Status: Provisional
+        Scriptable: Yes
+        """
+        ...
+
+    def get_data_items_by_uuids(self, data_item_uuids: typing.Sequence[uuid.UUID]) -> typing.List[typing.Optional[DataItem]]:
+        """Get the data items with the given UUIDs in a single call.
+
+        :param data_item_uuids: The UUIDs of the data items.
+        :return: The list of :py:class:`nion.swift.Facade.DataItem` objects, in the same order as the UUIDs. The entry
+            is None for UUIDs without a data item.
+
+        .. versionadded:: 1.0
+
+        Status: Provisional
+        Scriptable: Yes
+        """
+        ...
+
+    def get_dependency_graph(self, data_items: typing.Sequence[DataItem]) -> typing.Dict[uuid.UUID, typing.Tuple[typing.List[DataItem], typing.List[DataItem]]]:
+        """Return the source and dependent data items for each of the data items in a single call.
+
+        :param data_items: The list of :py:class:`nion.swift.Facade.DataItem` objects.
+        :return: A dict mapping the UUID of each data item to a tuple of (source data items, dependent data items).
+
+        Equivalent to calling :py:meth:`get_source_data_items` and :py:meth:`get_dependent_data_items` for each data
+        item, but the whole graph is gathered in one pass.
+
         .. versionadded:: 1.0
 
         Status: Provisional
@@ -781,6 +1348,20 @@ class Library:
         """
         ...
 
+    def get_graphics_by_uuids(self, graphic_uuids: typing.Sequence[uuid.UUID]) -> typing.List[typing.Optional[Graphic]]:
+        """Get the graphics with the given UUIDs in a single call.
+
+        :param graphic_uuids: The UUIDs of the graphics.
+        :return: The list of :py:class:`nion.swift.Facade.Graphic` objects, in the same order as the UUIDs. The entry is
+            None for UUIDs without a graphic.
+
+        .. versionadded:: 1.0
+
+        Status: Provisional
+        Scriptable: Yes
+        """
+        ...
+
     def get_library_value(self, key: str) -> typing.Any:
         """Get the library value for the given key.
 
@@ -827,6 +1408,22 @@ class Library:
         """
         ...
 
+    def iter_data_items(self, filter: typing.Callable[[DataItem], bool]=None, batch_size: int=None) -> typing.Iterator[DataItem]:
+        """Iterate over the data items lazily.
+
+        :param filter: A function taking a data item and returning whether to include it (optional).
+        :param batch_size: The number of data items to fetch from the library at a time. Pass None to use default.
+        :return: An iterator of :py:class:`nion.swift.Facade.DataItem` objects.
+
+        Unlike :py:attr:`data_items`, the full list is never built; data items are fetched in batches as the iterator
+        advances.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def set_library_value(self, key: str, value: typing.Any) -> None:
         """Set the library value for the given key.
 
@@ -847,6 +1444,26 @@ class Library:
         """
         ...
 
+    def transaction(self) -> "typing.ContextManager[None]":
+        """Return a context manager to apply changes to the library as a single transaction.
+
+        Changes to the title, calibrations, metadata and metadata values of any data items in the library made within
+        the context are written once and notified once, on exit. Use this when changing many data items; use
+        :py:meth:`nion.swift.Facade.DataItem.batch_update` when changing a single data item.
+
+        The semantics are the same as for ``batch_update``: if an exception is raised within the context, all of the
+        changes made within it are rolled back, nothing is written or notified and the exception propagates. Nested
+        transactions and batch updates join the outermost one.
+
+        Changes to the data itself are not part of the transaction; see
+        :py:meth:`nion.swift.Facade.DataItem.data_update`.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     @property
     def data_item_count(self) -> int:
         """Return the data item count.
@@ -948,7 +1565,34 @@ class DocumentWindow:
         """
         ...
 
-    def queue_task(self, fn) -> None:
+    def queue_task(self, fn: typing.Callable[[], typing.Any]) -> concurrent.futures.Future:
+        """Queue a function to be run on the UI thread.
+
+        :param fn: The function to run, taking no arguments.
+        :return: A future for the result of the function.
+
+        Do not wait on the future from the UI thread.
+
+        .. versionadded:: 1.0
+
+        Scriptable: No
+        """
+        ...
+
+    def queue_tasks(self, fns: typing.Sequence[typing.Callable[[], typing.Any]]) -> typing.List[concurrent.futures.Future]:
+        """Queue functions to be run together on the UI thread.
+
+        :param fns: The list of functions to run, each taking no arguments.
+        :return: The list of futures for the results, in the same order as the functions.
+
+        The functions are run in order during a single pass of the UI thread.
+
+        Do not wait on the futures from the UI thread.
+
+        .. versionadded:: 1.0
+
+        Scriptable: No
+        """
         ...
 
     def show_confirmation_message_box(self, caption: str, accepted_fn, rejected_fn=None, accepted_text: str=None, rejected_text: str=None, display_rejected: str=False) -> None:
@@ -1041,6 +1685,22 @@ class API:
     this class.
     """
 
+    def create_acquisition_group(self, hardware_sources: typing.Sequence):
+        """Create an acquisition group to acquire from several hardware sources together.
+
+        :param hardware_sources: The list of hardware sources, as returned from :py:meth:`get_hardware_source_by_id`.
+        :return: The :py:class:`nion.typeshed.HardwareSource_1_0.AcquisitionGroup` object.
+
+        The hardware sources are started together and their frames are returned aligned by timestamp.
+
+        Callers should call close on the returned group when finished.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def create_calibration(self, offset: float=None, scale: float=None, units: str=None) -> Calibration.Calibration:
         """Create a calibration object with offset, scale, and units.
 
@@ -1110,6 +1770,24 @@ class API:
         ...
 
     def create_hardware_source(self, hardware_source_delegate):
+        """Create a hardware source backed by a delegate and register it.
+
+        .. versionadded:: 1.0
+
+        Scriptable: No
+
+         The hardware_source_delegate should respond to the following:
+            (property, read-only) hardware_source_id
+            (property, read-only) hardware_source_name
+            (method, required) start_acquisition(), returns True if acquisition started
+            (method, required) acquire_data_and_metadata(), returns a DataAndMetadata, blocking until the frame is ready
+            (method, required) stop_acquisition()
+            (method, required) close()
+
+         The hardware source has a single data channel and only supports continuous (view) acquisition, where
+         acquire_data_and_metadata is called repeatedly between start_acquisition and stop_acquisition. Record
+         acquisition is not supported.
+        """
         ...
 
     def create_menu_item(self, menu_item_handler):
@@ -1132,6 +1810,21 @@ class API:
         """
         ...
 
+    def create_range(self, start: typing.Any=None, end: typing.Any=None) -> Range:
+        """Create a range to use as a condition when searching.
+
+        :param start: The start of the range (inclusive). Pass None to leave the range open at the start.
+        :param end: The end of the range (exclusive). Pass None to leave the range open at the end.
+        :return: The :py:class:`nion.swift.Facade.Range` object.
+
+        See :py:meth:`nion.swift.Facade.Library.find_data_items`.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def get_all_hardware_source_ids(self) -> typing.List[str]:
         ...
 
@@ -1150,7 +1843,49 @@ class API:
     def get_instrument_by_id(self, instrument_id: str, version: str):
         ...
 
-    def queue_task(self, fn) -> None:
+    def queue_task(self, fn: typing.Callable[[], typing.Any]) -> concurrent.futures.Future:
+        """Queue a function to be run on the UI thread.
+
+        :param fn: The function to run, taking no arguments.
+        :return: A future for the result of the function.
+
+        Do not wait on the future from the UI thread.
+
+        .. versionadded:: 1.0
+
+        Scriptable: No
+        """
+        ...
+
+    def queue_tasks(self, fns: typing.Sequence[typing.Callable[[], typing.Any]]) -> typing.List[concurrent.futures.Future]:
+        """Queue functions to be run together on the UI thread.
+
+        :param fns: The list of functions to run, each taking no arguments.
+        :return: The list of futures for the results, in the same order as the functions.
+
+        The functions are run in order during a single pass of the UI thread, so pushing many small updates costs one
+        UI thread wakeup rather than one per function.
+
+        Do not wait on the futures from the UI thread.
+
+        .. versionadded:: 1.0
+
+        Scriptable: No
+        """
+        ...
+
+    def queue_worker_task(self, fn: typing.Callable[[], typing.Any]) -> concurrent.futures.Future:
+        """Queue a function to be run on a shared pool of worker threads.
+
+        :param fn: The function to run, taking no arguments.
+        :return: A future for the result of the function.
+
+        Use this for work that should not run on the UI thread.
+
+        .. versionadded:: 1.0
+
+        Scriptable: No
+        """
         ...
 
     @property
@@ -4,11 +4,272 @@ import typing
 import uuid
 from nion.data import Calibration
 from nion.data import DataAndMetadata
+from nion.typeshed import API_1_0
+from nion.utils import Event
 from nion.utils import Geometry
 
 
+class AcquisitionMetrics:
+    """Represents a snapshot of the acquisition counters of a hardware source or view task.
+
+    Latencies are measured for each frame in the stages 'readout', 'queue', 'conversion', 'data_and_metadata' and
+    'notification' and accumulated into histograms with common bin edges.
+
+    Taking a snapshot copies the counters without stopping acquisition.
+
+    .. versionadded:: 1.0
+    """
+
+    def as_dict(self) -> dict:
+        """Return the metrics as a dict.
+
+        .. versionadded:: 1.0
+
+        The dict is convertible to JSON, e.g. ``json.dumps(metrics.as_dict())`` will succeed.
+        """
+        ...
+
+    def get_latency_histogram(self, stage: str) -> typing.List[int]:
+        """Return the latency histogram of a stage.
+
+        .. versionadded:: 1.0
+
+        :param stage: The name of the stage.
+        :return: The list of frame counts for each bin defined by :py:attr:`latency_bin_edges`.
+
+        Raises KeyError if the stage doesn't exist.
+        """
+        ...
+
+    def get_latency_percentile(self, stage: str, percentile: float) -> float:
+        """Return an estimate of a latency percentile of a stage, in seconds.
+
+        .. versionadded:: 1.0
+
+        :param stage: The name of the stage.
+        :param percentile: The percentile, in the range [0, 100].
+        :return: The latency in seconds.
+
+        Raises KeyError if the stage doesn't exist.
+        """
+        ...
+
+    @property
+    def buffer_occupancy(self) -> int:
+        """Return the number of frames currently held in the buffer.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def buffer_size(self) -> int:
+        """Return the size of the buffer.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def dropped_frame_count(self) -> int:
+        """Return the number of frames dropped because the buffer was full.
+
+        For a view task, these are the frames discarded by its overflow policy.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def frame_count(self) -> int:
+        """Return the number of frames acquired.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def frames_per_second(self) -> float:
+        """Return the recent frame rate.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def latency_bin_edges(self) -> typing.List[float]:
+        """Return the bin edges of the latency histograms, in seconds.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def overflow_policy(self) -> typing.Optional[str]:
+        """Return the overflow policy of the buffer, or None for a hardware source.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def stages(self) -> typing.List[str]:
+        """Return the names of the stages with latency histograms.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+
+class Frame:
+    """Represents a frame of data/metadata borrowed from the buffer ring of a view task.
+
+    The data in a frame is backed by a buffer owned by the view task. The buffer is reused for a later frame once the
+    frame is released, so the data must be copied if it is needed after release. A frame can be used as a context
+    manager, in which case it will be released on exit. Frames from :py:meth:`ViewTask.frames` and asynchronous
+    iteration are also released when the iterator advances.
+
+    A view task can only hand out as many unreleased frames as it has buffers. A buffer held by an unreleased frame is
+    never overwritten, whatever the overflow policy of the task. When all buffers are held, a newly finished frame has
+    no buffer to go into: with the 'block' overflow policy the task waits for a frame to be released before
+    continuing; with any other policy the new frame is discarded and counted in :py:attr:`ViewTask.dropped_frame_count`.
+    See :py:meth:`HardwareSource.create_view_task`.
+
+    .. versionadded:: 1.0
+    """
+
+    def __enter__(self) -> "Frame":
+        ...
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        ...
+
+    def release(self) -> None:
+        """Release the frame and return its buffers to the view task.
+
+        .. versionadded:: 1.0
+
+        The data and metadata items of the frame must not be used after the frame is released.
+        """
+        ...
+
+    @property
+    def data_and_metadata_list(self) -> typing.List[DataAndMetadata.DataAndMetadata]:
+        """Return the list of data and metadata items in the frame, one per enabled channel.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def frame_number(self) -> int:
+        """Return the frame number, counted from the start of the view task.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def is_released(self) -> bool:
+        """Return a boolean indicating whether the frame has been released.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+
+class FrameParameters(dict):
+    """Represents the frame parameters of a hardware source.
+
+    Frame parameters are a dict, so they can be passed anywhere a frame parameters dict is accepted. The typed
+    properties below are stored as items with the same key; other items are specific to the hardware source.
+
+    The region of interest, binning and (spatial) decimation are applied by the hardware source before the data
+    reaches Python, so only the pixels needed are moved and allocated. Use
+    :py:meth:`HardwareSource.get_data_shapes_and_dtypes` to get the resulting shapes.
+
+    Use :py:meth:`HardwareSource.create_frame_parameters` to create frame parameters.
+
+    .. versionadded:: 1.0
+    """
+
+    def set_roi_from_graphic(self, graphic: API_1_0.Graphic) -> None:
+        """Set the region of interest from the bounds of a rectangle graphic.
+
+        :param graphic: The rectangle :py:class:`nion.typeshed.API_1_0.Graphic`.
+
+        Equivalent to setting :py:attr:`roi_bounds` to ``graphic.bounds``.
+
+        Raises ValueError if the graphic is not a rectangle graphic.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def binning(self) -> int:
+        """Return the binning factor applied to both dimensions.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @binning.setter
+    def binning(self, value: int) -> None:
+        """Set the binning factor applied to both dimensions.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def decimation(self) -> int:
+        """Return the decimation factor, keeping one pixel in each block of decimation x decimation pixels.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @decimation.setter
+    def decimation(self, value: int) -> None:
+        """Set the decimation factor, keeping one pixel in each block of decimation x decimation pixels.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def roi_bounds(self) -> typing.Optional[typing.Tuple[typing.Tuple[float, float], typing.Tuple[float, float]]]:
+        """Return the region of interest in relative coordinates, or None for the full frame.
+
+        Bounds is a tuple ((top, left), (height, width))."""
+        ...
+
+    @roi_bounds.setter
+    def roi_bounds(self, value: typing.Optional[typing.Tuple[typing.Tuple[float, float], typing.Tuple[float, float]]]) -> None:
+        """Set the region of interest in relative coordinates, or None for the full frame.
+
+        Bounds is a tuple ((top, left), (height, width)). The hardware source may enlarge the region to satisfy
+        readout constraints."""
+        ...
+
+
 class RecordTask:
 
+    async def agrab(self) -> typing.List[DataAndMetadata.DataAndMetadata]:
+        """Grab list of data/metadata from the task without blocking the event loop.
+
+        .. versionadded:: 1.0
+
+        This method will wait until the task finishes. Cancelling the awaiting coroutine will cancel the task.
+
+        :return: The list of data and metadata items that were read.
+        :rtype: list of :py:class:`DataAndMetadata`
+
+        See :py:meth:`grab` for tasks created with out or data_items.
+        """
+        ...
+
     def cancel(self) -> None:
         ...
 
@@ -29,6 +290,23 @@ class RecordTask:
 
         This method will wait until the task finishes.
 
+        :return: The list of data and metadata items that were read.
+        :rtype: list of :py:class:`DataAndMetadata`
+
+        If the task was created with out or data_items (see :py:meth:`HardwareSource.create_record_task`), the data was
+        written into those arrays or data item slots during acquisition and the returned data and metadata items refer
+        to them without copying.
+        """
+        ...
+
+    def grab_partial(self) -> typing.List[DataAndMetadata.DataAndMetadata]:
+        """Grab list of data/metadata acquired so far from the task.
+
+        .. versionadded:: 1.0
+
+        This method will return immediately. For a record with collection dimensions, the positions not yet acquired
+        are zero. This is most useful with reduction masks, where the reduced images fill in while the record runs.
+
         :return: The list of data and metadata items that were read.
         :rtype: list of :py:class:`DataAndMetadata`
         """
@@ -45,6 +323,32 @@ class RecordTask:
 
 class ViewTask:
 
+    def __aiter__(self) -> "typing.AsyncIterator[Frame]":
+        """Iterate asynchronously over frames from the task as they finish.
+
+        .. versionadded:: 1.0
+
+        This is the asynchronous counterpart of :py:meth:`frames`. As with frames, advancing the iterator releases the
+        frame it yielded previously::
+
+            async for frame in view_task:
+                with frame:
+                    process(frame.data_and_metadata_list)
+        """
+        ...
+
+    async def agrab_next_to_finish(self) -> typing.List[DataAndMetadata.DataAndMetadata]:
+        """Grab list of data/metadata from the task without blocking the event loop.
+
+        .. versionadded:: 1.0
+
+        This method will wait until the current frame completes.
+
+        :return: The list of data and metadata items that were read.
+        :rtype: list of :py:class:`DataAndMetadata`
+        """
+        ...
+
     def close(self) -> None:
         """Close the task.
 
@@ -54,6 +358,25 @@ class ViewTask:
         """
         ...
 
+    def frames(self, timeout: float=None) -> typing.Iterator[Frame]:
+        """Iterate over frames from the task as they finish.
+
+        .. versionadded:: 1.0
+
+        :param timeout: The timeout in seconds to wait for each frame. Pass None to use default.
+        :return: An iterator of :py:class:`Frame` objects.
+
+        Each frame is backed by a buffer from the buffer ring of the task and must be released before its buffer can be
+        reused. No data is allocated per frame once the ring is filled.
+
+        Advancing the iterator releases the frame it yielded previously, if it has not been released already, so a loop
+        holds at most one frame at a time even with the default buffer size of 1. Copy the data of a frame to keep it
+        beyond the current iteration. Closing the iterator releases the last frame.
+
+        Iteration ends when the task is closed.
+        """
+        ...
+
     def grab_earliest(self) -> typing.List[DataAndMetadata.DataAndMetadata]:
         """Grab list of data/metadata from the task.
 
@@ -66,6 +389,21 @@ class ViewTask:
         """
         ...
 
+    def grab_frame(self, timeout: float=None) -> Frame:
+        """Grab the next frame to finish from the task without copying.
+
+        .. versionadded:: 1.0
+
+        :param timeout: The timeout in seconds. Pass None to use default.
+        :return: The :py:class:`Frame` object.
+
+        The frame must be released when no longer needed, typically by using it as a context manager::
+
+            with view_task.grab_frame() as frame:
+                process(frame.data_and_metadata_list)
+        """
+        ...
+
     def grab_immediate(self) -> typing.List[DataAndMetadata.DataAndMetadata]:
         """Grab list of data/metadata from the task.
 
@@ -90,6 +428,28 @@ class ViewTask:
         """
         ...
 
+    def grab_next_to_finish_into(self, data_items: typing.Sequence[API_1_0.DataItem], index: typing.Tuple[int, ...]) -> None:
+        """Grab data from the task directly into a slot of preallocated data items.
+
+        .. versionadded:: 1.0
+
+        This method will wait until the current frame completes.
+
+        :param data_items: The data items to receive the data, one per data and metadata item produced.
+        :type data_items: list of :py:class:`nion.typeshed.API_1_0.DataItem`
+        :param index: The index of the slot in the sequence and collection dimensions of the data items.
+        :type index: tuple of ints
+
+        The requirements on data items are those of :py:meth:`HardwareSource.create_record_task`: one data item for
+        each item produced, with each slot matching the shape and dtype given by
+        :py:meth:`HardwareSource.get_data_shapes_and_dtypes` with the accumulation parameters of the task. If the task
+        accumulates, the slot receives the aggregate so far, one data item per enabled channel.
+
+        Raises ValueError if the number of data items or the shapes or dtypes of their slots do not match the items
+        produced, or if the index is out of range.
+        """
+        ...
+
     def grab_next_to_start(self) -> typing.List[DataAndMetadata.DataAndMetadata]:
         """Grab list of data/metadata from the task.
 
@@ -99,22 +459,185 @@ class ViewTask:
 
         :return: The list of data and metadata items that were read.
         :rtype: list of :py:class:`DataAndMetadata`
-        """
-        ...
+        """
+        ...
+
+    def reset_accumulation(self) -> None:
+        """Discard the aggregate and start accumulating from the next frame.
+
+        .. versionadded:: 1.0
+
+        Has no effect if the task does not accumulate.
+        """
+        ...
+
+    @property
+    def accumulated_frame_count(self) -> int:
+        """Return the number of frames in the aggregate, or 0 if the task does not accumulate.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def dropped_frame_count(self) -> int:
+        """Return the number of frames discarded by the overflow policy of this task.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def metrics(self) -> AcquisitionMetrics:
+        """Return a snapshot of the acquisition metrics of this task.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+
+class SweepTask:
+    """Represents a sweep of frame parameters and control values executed back to back.
+
+    Results are passed to the callback on a pool of worker threads while the next steps are acquired, so processing
+    overlaps with acquisition.
+
+    .. versionadded:: 1.0
+    """
+
+    def cancel(self) -> None:
+        """Cancel the remaining steps of the sweep.
+
+        .. versionadded:: 1.0
+
+        Callbacks already running are allowed to finish.
+        """
+        ...
+
+    def close(self) -> None:
+        """Close the task.
+
+        .. versionadded:: 1.0
+
+        This method must be called when the task is no longer needed.
+        """
+        ...
+
+    def wait(self, timeout: float=None) -> None:
+        """Wait until all steps are acquired and all callbacks have finished.
+
+        .. versionadded:: 1.0
+
+        :param timeout: The timeout in seconds. Pass None to wait indefinitely.
+
+        Raises the first exception raised by a callback, if any.
+        """
+        ...
+
+    @property
+    def completed_count(self) -> int:
+        """Return the number of steps whose callbacks have finished.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def is_finished(self) -> bool:
+        """Return a boolean indicating whether all steps are acquired and all callbacks have finished.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+
+class HardwareSource:
+
+    def abort_playing(self) -> None:
+        ...
+
+    def abort_recording(self) -> None:
+        ...
+
+    async def agrab_next_to_finish(self, timeout: float=None) -> typing.List[DataAndMetadata.DataAndMetadata]:
+        """Grabs the next frame to finish and returns it as data and metadata without blocking the event loop.
+
+        .. versionadded:: 1.0
+
+        :param timeout: The timeout in seconds. Pass None to use default.
+        :return: The list of data and metadata items that were read.
+        :rtype: list of :py:class:`DataAndMetadata`
+
+        If the view is not already started, it will be started automatically.
+
+        Raises asyncio.TimeoutError if the timeout occurs.
+        """
+        ...
+
+    async def agrab_next_to_start(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, timeout: float=None) -> typing.List[DataAndMetadata.DataAndMetadata]:
+        """Grabs the next frame to start and returns it as data and metadata without blocking the event loop.
+
+        .. versionadded:: 1.0
+
+        :param frame_parameters: The frame parameters for the view. Pass None for defaults.
+        :type frame_parameters: :py:class:`FrameParameters`
+        :param channels_enabled: The enabled channels for the view. Pass None for defaults.
+        :type channels_enabled: List of booleans.
+        :param timeout: The timeout in seconds. Pass None to use default.
+        :return: The list of data and metadata items that were read.
+        :rtype: list of :py:class:`DataAndMetadata`
+
+        Raises asyncio.TimeoutError if the timeout occurs.
+        """
+        ...
+
+    async def arecord(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, timeout: float=None, out: typing.Sequence[numpy.ndarray]=None, reduction_masks: typing.Sequence[typing.Union[API_1_0.Graphic, numpy.ndarray]]=None) -> typing.List[DataAndMetadata.DataAndMetadata]:
+        """Record data and return a list of data_and_metadata objects without blocking the event loop.
+
+        .. versionadded:: 1.0
+
+        :param frame_parameters: The frame parameters for the record. Pass None for defaults.
+        :type frame_parameters: :py:class:`FrameParameters`
+        :param channels_enabled: The enabled channels for the record. Pass None for defaults.
+        :type channels_enabled: List of booleans.
+        :param timeout: The timeout in seconds. Pass None to use default.
+        :param out: The list of arrays to receive the data, one per data and metadata item returned. Pass None to
+            allocate new arrays.
+        :type out: list of :py:class:`numpy.ndarray`
+        :param reduction_masks: The masks to reduce each frame with. Pass None to not reduce.
+        :type reduction_masks: list of :py:class:`nion.typeshed.API_1_0.Graphic` or :py:class:`numpy.ndarray`
+        :return: The list of data and metadata items that were read.
+        :rtype: list of :py:class:`DataAndMetadata`
 
+        Cancelling the awaiting coroutine will abort the record.
 
-class HardwareSource:
+        See :py:meth:`record` for the requirements on out.
 
-    def abort_playing(self) -> None:
+        Raises asyncio.TimeoutError if the timeout occurs.
+        """
         ...
 
-    def abort_recording(self) -> None:
+    def close(self) -> None:
         ...
 
-    def close(self) -> None:
+    def create_frame_parameters(self, d: dict=None) -> FrameParameters:
+        """Create frame parameters for this hardware source.
+
+        .. versionadded:: 1.0
+
+        :param d: A dict of frame parameters to start from. Pass None for defaults.
+        :return: The :py:class:`FrameParameters` object.
+
+        Example::
+
+            frame_parameters = hardware_source.create_frame_parameters()
+            frame_parameters.set_roi_from_graphic(rectangle_graphic)
+            frame_parameters.binning = 2
+            hardware_source.record(frame_parameters)
+        """
         ...
 
-    def create_record_task(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None) -> RecordTask:
+    def create_record_task(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, accumulation_mode: str=None, accumulation_count: int=1, accumulation_options: dict=None, reduction_masks: typing.Sequence[typing.Union[API_1_0.Graphic, numpy.ndarray]]=None, out: typing.Sequence[numpy.ndarray]=None, data_items: typing.Sequence[API_1_0.DataItem]=None, data_item_index: typing.Tuple[int, ...]=None) -> RecordTask:
         """Create a record task for this hardware source.
 
         .. versionadded:: 1.0
@@ -123,16 +646,105 @@ class HardwareSource:
         :type frame_parameters: :py:class:`FrameParameters`
         :param channels_enabled: The enabled channels for the record. Pass None for defaults.
         :type channels_enabled: List of booleans.
+        :param accumulation_mode: The accumulation mode. Pass None to not accumulate.
+        :type accumulation_mode: str
+        :param accumulation_count: The number of frames to accumulate. Default is 1.
+        :type accumulation_count: int
+        :param accumulation_options: A dict of options for the accumulation mode. Pass None for defaults.
+        :type accumulation_options: dict
+        :param reduction_masks: The masks to reduce each frame with. Pass None to not reduce.
+        :type reduction_masks: list of :py:class:`nion.typeshed.API_1_0.Graphic` or :py:class:`numpy.ndarray`
+        :param out: The list of arrays to receive the data, one per data and metadata item produced. Pass None to
+            allocate new arrays.
+        :type out: list of :py:class:`numpy.ndarray`
+        :param data_items: The data items to receive the data, one per data and metadata item produced. Pass None to not
+            write into data items.
+        :type data_items: list of :py:class:`nion.typeshed.API_1_0.DataItem`
+        :param data_item_index: The index of the slot in the sequence and collection dimensions of the data items.
+            Required if data_items is passed.
+        :type data_item_index: tuple of ints
         :return: The :py:class:`RecordTask` object.
         :rtype: :py:class:`RecordTask`
 
+        The record starts when the task is created. If out is passed, the arrays are bound to the task before
+        acquisition starts and the data is written directly into them; :py:meth:`RecordTask.grab` then returns data and
+        metadata items referring to them. Each array must match the shape and dtype of the corresponding item and be
+        C-contiguous; use :py:meth:`get_data_shapes_and_dtypes` to determine the required shapes and dtypes and
+        :py:meth:`validate_output_buffers` to check the arrays. If the task accumulates, out receives the aggregate. If
+        the task reduces, out receives one reduced image per mask for each enabled channel. In either case pass the
+        accumulation parameters or reduction masks of the task to those methods. The arrays must not be used until the
+        task is finished.
+
+        Raises ValueError if the number, shapes or dtypes of the arrays in out do not match the items produced.
+
+        If data_items is passed, the data items and the slot at data_item_index are likewise bound to the task before
+        acquisition starts, and the data is written directly into the storage of the data items as it is acquired. The
+        storage is memory mapped for large format data items, so a long series can be recorded a slot at a time without
+        holding it in memory. There must be one data item for each item produced, in the order returned by grab, and the
+        slot (the dimensions of the data item after data_item_index) must match the shape and dtype of its item as given
+        by :py:meth:`get_data_shapes_and_dtypes` with the same accumulation parameters or reduction masks. Without
+        accumulation or reduction this is one data item per enabled channel with the frame as slot; if the task
+        accumulates, the slot receives the aggregate; if the task reduces, there is one data item per mask for each
+        enabled channel and the slot receives the reduced image. Use ``Library.create_data_item_from_data_descriptor``
+        to create the data items. :py:meth:`RecordTask.grab` returns data and metadata items referring to the slots.
+
+        Raises ValueError if the number of data items or the shapes or dtypes of their slots do not match the items
+        produced, if data_item_index is missing or out of range, or if both out and data_items are passed.
+
+        If an accumulation mode is passed, the task records accumulation_count frames and grab returns only the
+        aggregate, one per enabled channel. See :py:meth:`create_view_task` for accumulation modes and the shape and
+        dtype of the aggregate.
+
+        If reduction masks are passed, each frame is reduced as it arrives to the sum of the frame multiplied by each
+        mask, acting as a set of virtual detectors. Masks may be graphics, which are converted using
+        ``Graphic.mask_xdata_with_shape`` with the frame shape, or arrays with the frame shape. The full frames are not
+        kept, so for a record with collection dimensions (for example a camera synchronized with a scan) memory scales
+        with the number of masks rather than the number of frames. grab returns one data and metadata item per mask for
+        each enabled channel, ordered by channel and then by mask, with the datum dimensions removed: the shape is that
+        of the sequence and collection dimensions, or () for a single frame. The dtype is complex128 for complex frames,
+        otherwise float64.
+
+        Accumulation and reduction cannot be combined; raises ValueError if both an accumulation mode and reduction
+        masks are passed.
+
         Callers should call close on the returned task when finished.
 
         See :py:class:`RecordTask` for examples of how to use.
         """
         ...
 
-    def create_view_task(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, buffer_size: int=1) -> ViewTask:
+    def create_sweep_task(self, steps: typing.Sequence[dict], callback: typing.Callable[[int, typing.List[DataAndMetadata.DataAndMetadata]], None], *, channels_enabled: typing.List[bool]=None, instrument: "Instrument"=None, max_workers: int=None, max_pending: int=None) -> SweepTask:
+        """Create a sweep task for this hardware source.
+
+        .. versionadded:: 1.0
+
+        :param steps: The list of steps. Each step is a dict with optional keys 'frame_parameters' (a dict of frame
+            parameters to change from the previous step), 'control_outputs' (a dict mapping control names to values) and
+            'control_options' (the options passed when setting the control outputs).
+        :param callback: A function taking the step index and the list of data and metadata items recorded for the step.
+        :param channels_enabled: The enabled channels for the sweep. Pass None for defaults.
+        :type channels_enabled: List of booleans.
+        :param instrument: The instrument used to set control outputs. Required if any step has control outputs.
+        :param max_workers: The maximum number of threads running callbacks. Pass None to use default.
+        :param max_pending: The maximum number of recorded steps whose callbacks have not yet finished. Pass None to use
+            twice the number of workers.
+        :return: The :py:class:`SweepTask` object.
+        :rtype: :py:class:`SweepTask`
+
+        Each step applies its frame parameters and control outputs (see :py:meth:`Instrument.set_control_outputs`) and
+        records. The next step starts as soon as the record finishes, without waiting for the callback, unless
+        max_pending steps are already waiting for or running their callbacks; acquisition then blocks until a callback
+        finishes. This bounds the memory held by recorded data when callbacks are slower than acquisition.
+
+        Callbacks run on worker threads and may complete out of order.
+
+        Raises ValueError if max_workers or max_pending is less than 1.
+
+        Callers should call close on the returned task when finished.
+        """
+        ...
+
+    def create_view_task(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, buffer_size: int=1, overflow_policy: str="drop_oldest", decimation_interval: int=1, accumulation_mode: str=None, accumulation_options: dict=None) -> ViewTask:
         """Create a view task for this hardware source.
 
         .. versionadded:: 1.0
@@ -141,24 +753,122 @@ class HardwareSource:
         :type frame_parameters: :py:class:`FrameParameters`
         :param channels_enabled: The enabled channels for the view. Pass None for defaults.
         :type channels_enabled: List of booleans.
-        :param buffer_size: The buffer size if using the grab_earliest method. Default is 1.
+        :param buffer_size: The buffer size if using the grab_earliest method or the number of buffers in the ring if
+            using frames or grab_frame. Default is 1.
         :type buffer_size: int
+        :param overflow_policy: What to do with a new frame when the buffer is full. Default is 'drop_oldest'.
+        :type overflow_policy: str
+        :param decimation_interval: The interval between frames kept by the 'decimate' overflow policy when the buffer
+            is full. Default is 1.
+        :type decimation_interval: int
+        :param accumulation_mode: The accumulation mode. Pass None to not accumulate.
+        :type accumulation_mode: str
+        :param accumulation_options: A dict of options for the accumulation mode. Pass None for defaults.
+        :type accumulation_options: dict
         :return: The :py:class:`ViewTask` object.
         :rtype: :py:class:`ViewTask`
 
+        The overflow policy applies when a frame finishes and the buffer is full. Policies only act on finished frames
+        that have not been grabbed yet. Buffers handed out as :py:class:`Frame` objects by frames, grab_frame or async
+        iteration are never reclaimed until released; they count towards the buffer size but no policy can discard them.
+
+        Overflow policies are:
+            drop_oldest: discard the oldest ungrabbed frame to make room for the new frame.
+            drop_newest: discard the new frame.
+            block: wait for the consumer to grab a frame (or release a :py:class:`Frame`) before acquiring more frames.
+            decimate: keep the new frame only if its frame number is a multiple of decimation_interval, discarding the
+            oldest ungrabbed frame to make room; otherwise discard the new frame. Frames are never decimated while the
+            buffer has room.
+
+        If every buffer is held by an unreleased :py:class:`Frame`, there is no ungrabbed frame to discard: 'block'
+        waits for a release and every other policy discards the new frame.
+
+        Every discarded frame is counted in :py:attr:`ViewTask.dropped_frame_count`, so the count only increases when
+        the consumer falls behind.
+
+        Accumulation modes, with the shape and dtype of the aggregate for each channel, are:
+            sum: the element-wise sum of the frames. Same shape as the frame; int64 for signed integer frames, uint64
+            for unsigned integer frames, float64 for float frames and complex128 for complex frames.
+            mean: the element-wise mean of the frames. Same shape as the frame; complex128 for complex frames, otherwise
+            float64.
+            variance: the element-wise running variance of the frames. Same shape as the frame; float64.
+            minimum, maximum: the element-wise minimum or maximum of the frames. Same shape and dtype as the frame.
+            histogram: the histogram of the values of all the frames. A 1d array of shape (bins,); int64. Options are
+            bins (int, default 256) and range (a tuple of floats). The default range is the range of the data type for
+            integer frames and the minimum and maximum of the first frame accumulated for float frames; the range is
+            then fixed until the accumulation is reset, and values outside it are not counted.
+
+        Use :py:meth:`get_data_shapes_and_dtypes` with the same accumulation parameters to get the aggregate shapes.
+
+        If an accumulation mode is passed, each frame is accumulated in place as it arrives and the grab methods return
+        the aggregate so far instead of the latest frame. Likewise frames, grab_frame and async iteration yield a
+        :py:class:`Frame` holding a snapshot of the aggregate so far; its frame number is that of the last frame
+        accumulated. The aggregate is copied into a buffer of the ring only when the consumer takes a frame, not for
+        each frame accumulated, so accumulating allocates and copies nothing while no consumer is waiting. Frames
+        accumulated between two snapshots are part of the aggregate and are not counted as dropped. Use
+        :py:meth:`ViewTask.reset_accumulation` to start over.
+
+        Raises ValueError if the overflow policy or accumulation mode is not valid, or if decimation_interval is less
+        than 1. With the 'histogram' accumulation mode, raises ValueError when the first frame arrives if the frames are
+        complex.
+
         Callers should call close on the returned task when finished.
 
         See :py:class:`ViewTask` for examples of how to use.
         """
         ...
 
-    def get_default_frame_parameters(self) -> dict:
+    def get_data_shapes_and_dtypes(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, accumulation_mode: str=None, accumulation_options: dict=None, reduction_masks: typing.Sequence[typing.Union[API_1_0.Graphic, numpy.ndarray]]=None) -> typing.List[typing.Tuple[typing.Tuple[int, ...], numpy.dtype]]:
+        """Return the shape and dtype of each data and metadata item produced.
+
+        .. versionadded:: 1.0
+
+        :param frame_parameters: The frame parameters. Pass None for defaults.
+        :type frame_parameters: :py:class:`FrameParameters`
+        :param channels_enabled: The enabled channels. Pass None for defaults.
+        :type channels_enabled: List of booleans.
+        :param accumulation_mode: The accumulation mode of the task. Pass None if the task does not accumulate.
+        :type accumulation_mode: str
+        :param accumulation_options: The options for the accumulation mode. Pass None for defaults.
+        :type accumulation_options: dict
+        :param reduction_masks: The reduction masks of the record. Pass None if the record does not reduce.
+        :type reduction_masks: list of :py:class:`nion.typeshed.API_1_0.Graphic` or :py:class:`numpy.ndarray`
+        :return: The list of (shape, dtype) tuples, one per enabled channel, or one per mask for each enabled channel if
+            reduction masks are passed.
+
+        If an accumulation mode is passed, the shapes and dtypes are those of the aggregate rather than the frame. If
+        reduction masks are passed, they are those of the reduced data.
+
+        Raises ValueError if both an accumulation mode and reduction masks are passed.
+
+        Use this method to allocate arrays to pass as the out parameter of :py:meth:`record` or
+        :py:meth:`create_record_task`::
+
+            shapes_and_dtypes = hardware_source.get_data_shapes_and_dtypes(frame_parameters)
+            out = [numpy.empty(shape, dtype) for shape, dtype in shapes_and_dtypes]
+            hardware_source.record(frame_parameters, out=out)
+        """
+        ...
+
+    def get_default_frame_parameters(self) -> FrameParameters:
         ...
 
-    def get_frame_parameters(self) -> dict:
+    def get_frame_parameters(self) -> FrameParameters:
         ...
 
-    def get_frame_parameters_for_profile_by_index(self, profile_index: int) -> dict:
+    def get_frame_parameters_for_profile_by_index(self, profile_index: int) -> FrameParameters:
+        ...
+
+    def get_metrics(self) -> AcquisitionMetrics:
+        """Return a snapshot of the acquisition metrics of this hardware source.
+
+        .. versionadded:: 1.0
+
+        :return: The :py:class:`AcquisitionMetrics` object.
+
+        The metrics are accumulated since the hardware source was created or since the last call to
+        :py:meth:`reset_metrics`.
+        """
         ...
 
     def get_property_as_bool(self, name):
@@ -194,7 +904,7 @@ class HardwareSource:
     def grab_next_to_start(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, timeout: float=None) -> typing.List[DataAndMetadata.DataAndMetadata]:
         ...
 
-    def record(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, timeout: float=None) -> typing.List[DataAndMetadata.DataAndMetadata]:
+    def record(self, frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, timeout: float=None, out: typing.Sequence[numpy.ndarray]=None, reduction_masks: typing.Sequence[typing.Union[API_1_0.Graphic, numpy.ndarray]]=None) -> typing.List[DataAndMetadata.DataAndMetadata]:
         """Record data and return a list of data_and_metadata objects.
 
         .. versionadded:: 1.0
@@ -204,8 +914,31 @@ class HardwareSource:
         :param channels_enabled: The enabled channels for the record. Pass None for defaults.
         :type channels_enabled: List of booleans.
         :param timeout: The timeout in seconds. Pass None to use default.
+        :param out: The list of arrays to receive the data, one per data and metadata item returned. Pass None to
+            allocate new arrays.
+        :type out: list of :py:class:`numpy.ndarray`
+        :param reduction_masks: The masks to reduce each frame with. Pass None to not reduce.
+        :type reduction_masks: list of :py:class:`nion.typeshed.API_1_0.Graphic` or :py:class:`numpy.ndarray`
         :return: The list of data and metadata items that were read.
         :rtype: list of :py:class:`DataAndMetadata`
+
+        If out is passed, the data is written directly into the arrays and the returned data and metadata items refer to
+        them. Each array must match the shape and dtype of the corresponding item and be C-contiguous; use
+        :py:meth:`get_data_shapes_and_dtypes` to determine the required shapes and dtypes and
+        :py:meth:`validate_output_buffers` to check the arrays before starting the record.
+
+        If reduction masks are passed, the reduced data is returned instead of the frames, one item per mask for each
+        enabled channel. See :py:meth:`create_record_task` for details. In this case out must match the reduced data;
+        pass the same reduction masks to get_data_shapes_and_dtypes and validate_output_buffers.
+
+        Raises ValueError if the number, shapes or dtypes of the arrays in out do not match the items returned.
+        """
+        ...
+
+    def reset_metrics(self) -> None:
+        """Reset the acquisition metrics of this hardware source.
+
+        .. versionadded:: 1.0
         """
         ...
 
@@ -239,6 +972,32 @@ class HardwareSource:
     def stop_playing(self) -> None:
         ...
 
+    def validate_output_buffers(self, out: typing.Sequence[numpy.ndarray], frame_parameters: dict=None, channels_enabled: typing.List[bool]=None, accumulation_mode: str=None, accumulation_options: dict=None, reduction_masks: typing.Sequence[typing.Union[API_1_0.Graphic, numpy.ndarray]]=None) -> None:
+        """Check that arrays can be passed as the out parameter of a record.
+
+        .. versionadded:: 1.0
+
+        :param out: The list of arrays to check, one per data and metadata item produced.
+        :type out: list of :py:class:`numpy.ndarray`
+        :param frame_parameters: The frame parameters of the record. Pass None for defaults.
+        :type frame_parameters: :py:class:`FrameParameters`
+        :param channels_enabled: The enabled channels of the record. Pass None for defaults.
+        :type channels_enabled: List of booleans.
+        :param accumulation_mode: The accumulation mode of the record task. Pass None if the task does not accumulate.
+        :type accumulation_mode: str
+        :param accumulation_options: The options for the accumulation mode. Pass None for defaults.
+        :type accumulation_options: dict
+        :param reduction_masks: The reduction masks of the record. Pass None if the record does not reduce.
+        :type reduction_masks: list of :py:class:`nion.typeshed.API_1_0.Graphic` or :py:class:`numpy.ndarray`
+
+        Performs the same checks as :py:meth:`record` and :py:meth:`create_record_task` without starting a record, so
+        buffers can be validated once and then reused.
+
+        Raises ValueError if the number of arrays does not match the number of items produced, or if any array does not
+        match the shape and dtype reported by :py:meth:`get_data_shapes_and_dtypes` or is not C-contiguous.
+        """
+        ...
+
     @property
     def is_playing(self) -> bool:
         ...
@@ -256,6 +1015,166 @@ class HardwareSource:
         ...
 
 
+class AcquisitionGroupFrame:
+    """Represents the data/metadata acquired by the sources of an acquisition group for one frame.
+
+    .. versionadded:: 1.0
+    """
+
+    @property
+    def data_and_metadata_lists(self) -> typing.List[typing.List[DataAndMetadata.DataAndMetadata]]:
+        """Return the list of data and metadata items for each hardware source, in the order of the group.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def frame_index(self) -> int:
+        """Return the index of the frame within the record.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Return the timestamp (UTC) of the start of the frame, common to all hardware sources.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+
+class AcquisitionGroup:
+    """Represents a group of hardware sources acquiring together.
+
+    The hardware sources in the group are started together and each frame of each source corresponds to the same
+    frame of the other sources. Readout of one frame is pipelined with the exposure of the next.
+
+    Use :samp:`api.create_acquisition_group(hardware_sources)` to create an acquisition group. Callers should call close
+    on the group when finished.
+
+    .. versionadded:: 1.0
+    """
+
+    async def arecord(self, frame_count: int=1, frame_parameters_list: typing.Sequence[dict]=None, channels_enabled_list: typing.Sequence[typing.List[bool]]=None, timeout: float=None, reduction_masks_list: typing.Sequence[typing.Optional[typing.Sequence[typing.Union[API_1_0.Graphic, numpy.ndarray]]]]=None) -> typing.List[AcquisitionGroupFrame]:
+        """Record frames from all hardware sources without blocking the event loop.
+
+        .. versionadded:: 1.0
+
+        See :py:meth:`record` for parameters. Cancelling the awaiting coroutine will cancel the record.
+
+        Raises asyncio.TimeoutError if the timeout occurs.
+        """
+        ...
+
+    def cancel(self) -> None:
+        ...
+
+    def close(self) -> None:
+        """Close the acquisition group.
+
+        .. versionadded:: 1.0
+
+        This method must be called when the group is no longer needed.
+        """
+        ...
+
+    def record(self, frame_count: int=1, frame_parameters_list: typing.Sequence[dict]=None, channels_enabled_list: typing.Sequence[typing.List[bool]]=None, timeout: float=None, reduction_masks_list: typing.Sequence[typing.Optional[typing.Sequence[typing.Union[API_1_0.Graphic, numpy.ndarray]]]]=None) -> typing.List[AcquisitionGroupFrame]:
+        """Record frames from all hardware sources together.
+
+        .. versionadded:: 1.0
+
+        :param frame_count: The number of frames to record.
+        :param frame_parameters_list: The frame parameters for each hardware source. Pass None for defaults.
+        :type frame_parameters_list: list of :py:class:`FrameParameters`
+        :param channels_enabled_list: The enabled channels for each hardware source. Pass None for defaults.
+        :type channels_enabled_list: list of lists of booleans.
+        :param timeout: The timeout in seconds. Pass None to use default.
+        :param reduction_masks_list: The reduction masks for each hardware source, or None for a source that is not
+            reduced. Pass None to not reduce any source.
+        :type reduction_masks_list: list of lists of :py:class:`nion.typeshed.API_1_0.Graphic` or
+            :py:class:`numpy.ndarray`
+        :return: The list of frames, each holding the data from every hardware source.
+        :rtype: list of :py:class:`AcquisitionGroupFrame`
+
+        The frames are aligned by timestamp: the data from each hardware source in a frame was acquired during the same
+        exposure.
+
+        The reduction masks of a hardware source are applied to each of its frames as it arrives, as described in
+        :py:meth:`HardwareSource.create_record_task`. When a camera is synchronized with a scan, the masks are applied
+        to the camera frame at each scan position, so the camera contributes one reduced image per mask for each enabled
+        channel, with the shape of the scan, in place of the full camera frames; the scan data is unaffected. Use
+        :py:meth:`HardwareSource.get_data_shapes_and_dtypes` with the masks of a source to get the shapes of its items.
+
+        Raises ValueError if a source is given reduction masks that do not match its frame shape.
+        """
+        ...
+
+    @property
+    def hardware_sources(self) -> typing.List[HardwareSource]:
+        """Return the hardware sources in the group.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def is_recording(self) -> bool:
+        ...
+
+
+class InstrumentChangeEvent:
+    """Represents a change to a control or property of an instrument.
+
+    Changes are coalesced: when a value changes several times within the minimum interval of an observer, a single
+    event is delivered with the value from the previous event and the latest value.
+
+    .. versionadded:: 1.0
+    """
+
+    @property
+    def name(self) -> str:
+        """Return the name of the control or property that changed.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def new_value(self) -> typing.Any:
+        """Return the new value (the control output for controls).
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def old_value(self) -> typing.Any:
+        """Return the value delivered in the previous event (the control output for controls).
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def state(self) -> typing.Optional[str]:
+        """Return the control state at the time of the change, or None for properties.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Return the timestamp (UTC) of the latest change as a datetime object.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+
 class Instrument:
     """Represents an instrument with controls and properties.
 
@@ -271,9 +1190,71 @@ class Instrument:
     begin/end transaction should be matched.
     """
 
+    def aobserve(self, names: typing.Sequence[str], *, min_interval: float=None) -> "typing.AsyncIterator[InstrumentChangeEvent]":
+        """Iterate asynchronously over changes to controls and properties.
+
+        :param names: The names of the controls and properties to observe.
+        :param min_interval: The minimum interval in seconds between events for the same name. Pass None for no limit.
+        :return: An asynchronous iterator of :py:class:`InstrumentChangeEvent` objects.
+
+        This is the asynchronous counterpart of :py:meth:`observe`::
+
+            async for change_event in instrument.aobserve(["defocus"], min_interval=0.1):
+                print(change_event.name, change_event.new_value)
+
+        Raises exception if any control or property with name doesn't exist.
+
+        .. versionadded:: 1.0
+        """
+        ...
+
+    def begin_temporary_state(self) -> None:
+        """Begin a temporary state.
+
+        Changes to controls and properties made after this call are restored by the matching
+        :py:meth:`end_temporary_state`.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def begin_transaction(self) -> None:
+        """Begin a transaction.
+
+        Changes to controls and properties made after this call are applied together by the matching
+        :py:meth:`end_transaction`.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def close(self) -> None:
         ...
 
+    def end_temporary_state(self) -> None:
+        """End a temporary state and restore the controls and properties changed since it began.
+
+        The original values are restored in a single operation.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def end_transaction(self) -> None:
+        """End a transaction and apply the changes made since it began.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def get_control_output(self, name: str) -> float:
         """Return the value of a control.
 
@@ -315,6 +1296,45 @@ class Instrument:
     def get_property_as_str(self, name: str) -> str:
         ...
 
+    def get_state(self, names: typing.Sequence[str]) -> typing.Dict[str, typing.Any]:
+        """Return the values of several controls and properties in a single call.
+
+        :param names: The names of the controls and properties.
+        :return: A dict mapping each name to its value.
+
+        Control values are the control outputs (float). Property values have the type of the property.
+
+        The returned dict can be passed to :py:meth:`set_state` to restore the values.
+
+        Raises exception if any control or property with name doesn't exist.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def observe(self, names: typing.Sequence[str], callback: typing.Callable[[InstrumentChangeEvent], None], *, min_interval: float=None) -> Event.EventListener:
+        """Observe changes to controls and properties.
+
+        :param names: The names of the controls and properties to observe.
+        :param callback: A function taking an :py:class:`InstrumentChangeEvent`, called for each change.
+        :param min_interval: The minimum interval in seconds between events for the same name. Pass None for no limit.
+        :return: The listener object. Call close on it to stop observing.
+
+        Changes are pushed by the instrument, so there is no need to poll :py:meth:`get_control_output` or
+        :py:meth:`get_control_state`. Changes within min_interval are coalesced into a single event.
+
+        The callback may be called on a thread other than the calling thread.
+
+        Raises exception if any control or property with name doesn't exist.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def set_control_output(self, name: str, value: float, *, options: dict=None) -> None:
         """Set the value of a control asynchronously.
 
@@ -348,6 +1368,28 @@ class Instrument:
         """
         ...
 
+    def set_control_outputs(self, values: typing.Mapping[str, float], *, options: dict=None) -> typing.Dict[str, bool]:
+        """Set the values of several controls together.
+
+        :param values: A dict mapping control names (string) to control values (float).
+        :param options: A dict of custom options to pass to the instrument for setting the values.
+        :return: A dict mapping each control name to whether its value was confirmed.
+
+        Options are the same as for :py:meth:`set_control_output` and apply to every control.
+
+        All values are dispatched to the instrument together. If confirm is True, the values are confirmed concurrently
+        and confirm_timeout applies to the group as a whole rather than to each control. Controls that are not
+        confirmed before the timeout are reported as False instead of raising TimeoutException. If confirm is False,
+        every control is reported as True.
+
+        Raises exception if any control name doesn't exist, in which case no values are set.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
     def set_property_as_bool(self, name: str, value: bool) -> None:
         ...
 
@@ -374,4 +1416,45 @@ class Instrument:
     def set_property_as_str(self, name: str, value: str) -> None:
         ...
 
+    def set_state(self, state: typing.Mapping[str, typing.Any]) -> None:
+        """Set the values of several controls and properties in a single call.
+
+        :param state: A dict mapping control and property names to values, typically returned from :py:meth:`get_state`.
+
+        Control values are set as control outputs. The values are applied together as a transaction.
+
+        Raises exception if any control or property with name doesn't exist, in which case no values are set.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def temporary_state(self) -> "typing.ContextManager[None]":
+        """Return a context manager for a temporary state.
+
+        Equivalent to calling :py:meth:`begin_temporary_state` on enter and :py:meth:`end_temporary_state` on exit::
+
+            with instrument.temporary_state():
+                instrument.set_control_output("defocus", 100e-9)
+                hardware_source.record()
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
+    def transaction(self) -> "typing.ContextManager[None]":
+        """Return a context manager for a transaction.
+
+        Equivalent to calling :py:meth:`begin_transaction` on enter and :py:meth:`end_transaction` on exit.
+
+        .. versionadded:: 1.0
+
+        Scriptable: Yes
+        """
+        ...
+
 version = "~1.0"